@@ -0,0 +1,54 @@
+"""algorithms/_wmsr_kernel.py
+
+Optional Numba‑compiled trimming kernel for :class:`algorithms.wmsr.WMSR`.
+
+For high‑degree agents the interpreted select‑and‑sum in ``WMSR.step``
+dominates the round.  When **numba** is installed this module exposes
+:func:`trim_mean`, a JIT‑compiled version of the same update; otherwise
+``trim_mean`` is ``None`` and callers keep the pure‑Python path.
+
+``cache=True`` writes the compiled artefact next to the module, so only
+the first agent process of a run pays the compile cost.
+"""
+
+from __future__ import annotations
+
+from typing import Collection, Tuple
+
+__all__ = ["trim_mean"]
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # numba is optional – pure‑Python fallback in wmsr.py
+    trim_mean = None
+else:
+
+    @njit(cache=True)
+    def _trim_mean(vals, current, F):  # pragma: no cover – compiled
+        lo = 0
+        hi = 0
+        for v in vals:
+            if v < current:
+                lo += 1
+            elif v > current:
+                hi += 1
+
+        # Partial selection: push the dropped extremes to either end
+        kept = vals
+        n_low = min(F, lo)
+        if n_low:
+            kept = np.partition(kept, n_low - 1)[n_low:]
+        n_high = min(F, hi)
+        if n_high:
+            kept = np.partition(kept, kept.size - n_high)[: kept.size - n_high]
+
+        next_val = (kept.sum() + current) / (kept.size + 1)
+        return next_val, abs(next_val - current)
+
+    def trim_mean(
+        values: Collection[float], current: float, F: int
+    ) -> Tuple[float, float]:
+        """Return ``(next_value, delta)`` for one W‑MSR update of ``values``."""
+        vals = np.fromiter(values, dtype=np.float64, count=len(values))
+        return _trim_mean(vals, current, F)
@@ -31,13 +31,20 @@ round limit is reached.
 
 from __future__ import annotations
 
+import heapq
 import math
+from collections import Counter
 from typing import Iterable, Mapping, MutableMapping
 
 from core.algorithm import Algorithm, register_algorithm
 
 __all__ = ["WMSR"]
 
+# Below this many neighbours the ndarray conversion costs more than the
+# compiled kernel saves, so the pure‑Python path is used (and numba is never
+# imported – its import alone takes a sizeable chunk of the startup holdoff).
+_JIT_MIN_DEGREE = 64
+
 
 @register_algorithm("wmsr")  # registers class under key 'wmsr'
 class WMSR(Algorithm):
@@ -63,6 +70,15 @@ class WMSR(Algorithm):
         if self._F < 0:
             raise ValueError("F must be ≥ 0")
         self._delta = math.inf  # change magnitude from last step
+        self._jit_trim_mean = None
+        if len(self._neigh) >= _JIT_MIN_DEGREE:
+            from algorithms._wmsr_kernel import trim_mean
+
+            if trim_mean is not None:
+                # Compile (or load from cache) now, during the holdoff – a
+                # first‑call compile inside round 0 would overrun many slots.
+                trim_mean((0.0, 1.0), 0.5, self._F)
+            self._jit_trim_mean = trim_mean
 
     # ------------------------------------------------------------------
     # Core update
@@ -72,24 +88,31 @@ class WMSR(Algorithm):
         """Perform one W‑MSR update and return next value to broadcast."""
 
         current = self._value
-        neighbour_vals = list(inbox.values())
-
-        # Partition neighbour values relative to current value
-        lower = sorted(v for v in neighbour_vals if v < current)
-        higher = sorted((v for v in neighbour_vals if v > current), reverse=True)
-
-        # Drop up to F extreme values on each side
-        pruned = neighbour_vals.copy()
-        for v in lower[: self._F]:
-            pruned.remove(v)
-        for v in higher[: self._F]:
-            pruned.remove(v)
-
-        # Include own value in the averaging set
-        pruned.append(current)
-
-        # Resilient average (uniform weights)
-        next_val = sum(pruned) / len(pruned)
+        F = self._F
+
+        if self._jit_trim_mean is not None and len(inbox) >= _JIT_MIN_DEGREE:
+            next_val, self._delta = self._jit_trim_mean(inbox.values(), current, F)
+            self._value = next_val
+            return next_val
+
+        vals = list(inbox.values())
+
+        # Only the F extremes on each side matter, so select them with
+        # bounded heaps (O(d log F)) instead of ordering the whole list.
+        kept = vals
+        if F:
+            drop = Counter(heapq.nsmallest(F, (v for v in vals if v < current)))
+            drop.update(heapq.nlargest(F, (v for v in vals if v > current)))
+            if drop:
+                kept = []
+                for v in vals:
+                    if drop[v]:  # multiset: drop each extreme exactly once
+                        drop[v] -= 1
+                    else:
+                        kept.append(v)
+
+        # Resilient average (uniform weights) – own value is always included
+        next_val = (sum(kept) + current) / (len(kept) + 1)
 
         # Track convergence metric
         self._delta = abs(next_val - current)
@@ -12,6 +12,8 @@ Design goals
 ------------
 * No `asyncio` dependency – agents run a simple, fast time‑slot loop.
 * Non‑blocking receive so we can harvest all messages until a deadline.
+* Blocking :py:meth:`ZmqTransport.poll` so callers wait in the kernel, not
+  in a sleep/spin loop.
 * Automatic context teardown – when the process exits, sockets close.
 * Minimal footprint – ~70 LOC including docstrings & typing.
 
@@ -21,6 +23,7 @@ Example
 ...                  neigh_endpoints=["tcp://127.0.0.1:5557"])  # doctest: +SKIP
 >>> t.send(b"hello")
 >>> msg = t.recv_nowait()
+>>> batch = t.drain()
 >>> t.close()
 """
 
@@ -30,7 +33,7 @@ import logging
 import os
 import socket
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 
 import zmq
 
@@ -64,19 +67,33 @@ class ZmqTransport:
         should connect to – usually the neighbours’ PUB addresses.
     ctx:
         Optionally reuse an existing ``zmq.Context``.  If ``None`` the class
-        creates and owns its own singleton context.
+        creates, owns and terminates its own context.
     host:
         Local host/interface to bind the PUB socket (default ``"127.0.0.1"``).
+    pub_endpoint:
+        Full endpoint to bind instead of ``tcp://host:pub_port`` – e.g. an
+        ``ipc://`` or ``inproc://`` address for single‑machine runs.
+    io_threads:
+        ZeroMQ I/O threads for an owned context (ignored if ``ctx`` given).
+    hwm:
+        Send/receive high‑water mark in messages.  The libzmq default of
+        1000 silently drops frames under bursty fan‑in.
     """
 
     pub_port: int
     neigh_endpoints: List[str]
     ctx: Optional[zmq.Context] = None
     host: str = "127.0.0.1"
+    pub_endpoint: Optional[str] = None
+    io_threads: int = 1
+    hwm: int = 10_000
 
     # internal fields (created in __post_init__)
+    _own_ctx: bool = False
     _pub_socket: zmq.Socket | None = None
     _sub_socket: zmq.Socket | None = None
+    _poller: zmq.Poller | None = None
+    _send: Callable[..., Any] | None = None  # bound PUB send (hot path)
 
     # ---------------------------------------------------------------------
     # Construction & teardown
@@ -84,31 +101,39 @@ class ZmqTransport:
 
     def __post_init__(self) -> None:  # noqa: D401 – standard dataclass hook
         if self.ctx is None:
-            # One context per process is recommended.  We don’t enforce the
-            # singleton, but we strongly hint via an env variable.
-            self.ctx = zmq.Context.instance()
+            # One context per process is recommended; an agent process owns
+            # exactly one transport, so sizing the context here is safe.
+            self.ctx = zmq.Context(io_threads=self.io_threads)
+            self._own_ctx = True
 
         # PUB socket – bind once.
         self._pub_socket = self.ctx.socket(zmq.PUB)
         self._pub_socket.setsockopt(zmq.LINGER, 0)
-        pub_endpoint = build_endpoint(self.host, self.pub_port)
-        self._pub_socket.bind(pub_endpoint)
-        log.debug("PUB bound to %s", pub_endpoint)
+        self._pub_socket.setsockopt(zmq.SNDHWM, self.hwm)
+        if self.pub_endpoint is None:
+            self.pub_endpoint = build_endpoint(self.host, self.pub_port)
+        self._pub_socket.bind(self.pub_endpoint)
+        self._send = self._pub_socket.send
+        log.debug("PUB bound to %s", self.pub_endpoint)
 
         # SUB socket – connect to all neighbours.
         self._sub_socket = self.ctx.socket(zmq.SUB)
         self._sub_socket.setsockopt_string(zmq.SUBSCRIBE, "")  # subscribe ALL
         self._sub_socket.setsockopt(zmq.LINGER, 0)
+        self._sub_socket.setsockopt(zmq.RCVHWM, self.hwm)
+        # The runner never lists an agent as its own neighbour, so every
+        # endpoint is connected as-is.
         for ep in self.neigh_endpoints:
-            # Skip self‑connect, but it’s harmless if we don’t.
-            if ep.endswith(f":{self.pub_port}"):
-                continue
             self._sub_socket.connect(ep)
             log.debug("SUB connected to %s", ep)
 
+        # Poller lets callers park in the kernel until a frame arrives.
+        self._poller = zmq.Poller()
+        self._poller.register(self._sub_socket, zmq.POLLIN)
+
         # small sanity check – warn if no peers (lonely agent)
         if not self.neigh_endpoints:
-            log.warning("Agent on port %d has no neighbour endpoints", self.pub_port)
+            log.warning("Agent at %s has no neighbour endpoints", self.pub_endpoint)
 
     # ------------------------------------------------------------------
     # Public API
@@ -116,9 +141,8 @@ class ZmqTransport:
 
     def send(self, data: bytes) -> None:
         """Broadcast ``data`` (non‑blocking).  Drops if the inproc buffer is full."""
-        assert self._pub_socket is not None
         try:
-            self._pub_socket.send(data, zmq.NOBLOCK)
+            self._send(data, zmq.NOBLOCK)
         except zmq.Again:
             # PUB sockets drop when HWM is reached – we silently log and move on
             log.warning("PUB buffer full – dropped message (%d bytes)", len(data))
@@ -131,6 +155,23 @@ class ZmqTransport:
         except zmq.Again:
             return None
 
+    def drain(self, max_msgs: int = 1024) -> List[bytes]:
+        """Return up to ``max_msgs`` queued messages in one go (non‑blocking)."""
+        sock = self._sub_socket
+        assert sock is not None
+        msgs: List[bytes] = []
+        try:
+            while len(msgs) < max_msgs:
+                msgs.append(sock.recv(zmq.NOBLOCK))
+        except zmq.Again:
+            pass
+        return msgs
+
+    def poll(self, timeout_ms: int) -> bool:
+        """Block up to ``timeout_ms`` for an incoming frame; ``True`` if one is ready."""
+        assert self._poller is not None
+        return bool(self._poller.poll(timeout_ms))
+
     # ------------------------------------------------------------------
     # Cleanup helpers (idempotent)
     # ------------------------------------------------------------------
@@ -138,11 +179,19 @@ class ZmqTransport:
     def close(self) -> None:  # noqa: D401 – not a property
         """Close sockets (safe to call multiple times)."""
         if self._pub_socket is not None:
+            self._send = None
             self._pub_socket.close(0)
             self._pub_socket = None
         if self._sub_socket is not None:
+            if self._poller is not None:
+                self._poller.unregister(self._sub_socket)
+                self._poller = None
             self._sub_socket.close(0)
             self._sub_socket = None
+        if self._own_ctx and self.ctx is not None:
+            self.ctx.term()
+            self.ctx = None
+            self._own_ctx = False
 
     # Automatic cleanup for context manager usage
     def __enter__(self):
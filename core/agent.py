@@ -5,27 +5,58 @@ per process, so the 4‑byte sender IDs we embedded in each message didn’t
 match across agents.  Consequently every receiver discarded incoming
 packets as “unknown sender”, and the algorithm never updated.
 
-We now use **`zlib.crc32(id.encode())`** instead of `hash(id)` so the
-value is stable across all processes and runs.
+We now use a **CRC‑32** of the ID instead of `hash(id)` so the value is
+stable across all processes and runs.  The runner records the variant in
+the run‑file (``"sender_hash"``): the hardware‑accelerated CRC‑32C
+(SSE4.2 / ARMv8) when the ``crc32c`` package is installed on its host,
+otherwise `zlib.crc32`.  Agents use exactly that variant and refuse to
+start if it is unavailable, so mixed hosts fail loudly instead of
+dropping every frame.
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import os
-import sys
 import time
 from pathlib import Path
-from typing import Dict, List, MutableMapping
+from typing import BinaryIO, Callable, Dict, List, MutableMapping, Optional, Type
 import importlib
 import struct
-import zlib  # NEW – deterministic 32‑bit hash
+
+from zlib import crc32 as _zlib_crc32
+
+try:  # deterministic 32‑bit hash – hardware CRC‑32C if available
+    from crc32c import crc32c as _crc32c
+except ImportError:
+    _crc32c = None
+
+try:  # orjson parses the run‑file several times faster than stdlib json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from comm.zmq_transport import ZmqTransport, build_endpoint
 from core.algorithm import Algorithm, get_algorithm
 from sync.timeslot import SlotConfig, wait_for_round_start
 
+# Sender‑ID hashes available on this host, by run‑file name.
+_SENDER_HASHES: Dict[str, Callable[[bytes], int]] = {"crc32": _zlib_crc32}
+if _crc32c is not None:
+    _SENDER_HASHES["crc32c"] = _crc32c
+
+#: Variant the runner records for new runs (best one installed here).
+DEFAULT_SENDER_HASH = "crc32c" if _crc32c is not None else "crc32"
+
+# Wire format: sender CRC, round number, value – compiled once.
+_MSG = struct.Struct("!IId")
+
+# Trajectory log record: round number, value (little‑endian, 12 bytes).
+_LOG = struct.Struct("<id")
+
+# Records buffered between flushes of the trajectory log.
+_LOG_FLUSH_ROUNDS = 64
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -37,6 +68,7 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:  # noqa: D4
     p.add_argument("--algo", required=True)
     p.add_argument("--eps", type=float, default=0.0)
     p.add_argument("--initial", type=float, default=0.0)
+    p.add_argument("--log", help="Binary trajectory output (default agent_<ID>.bin)")
     return p.parse_args(argv)
 
 
@@ -45,13 +77,45 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:  # noqa: D4
 # ---------------------------------------------------------------------------
 
 def load_runfile(path: Path) -> Dict:
-    with path.open("rt", encoding="utf-8") as fh:
-        return json.load(fh)
+    return _json_loads(path.read_bytes())
 
 
-def crc32_id(aid: str) -> int:
+def agent_endpoint(acfg: Dict) -> str:
+    """PUB endpoint of a run‑file agent entry (``host``/``pub`` if older)."""
+    return acfg.get("endpoint") or build_endpoint(acfg["host"], acfg["pub"])
+
+
+def sender_hash(name: str) -> Callable[[bytes], int]:
+    """Return the CRC function the run‑file's ``sender_hash`` names."""
+    try:
+        return _SENDER_HASHES[name]
+    except KeyError:
+        raise RuntimeError(
+            f"run-file sender_hash {name!r} is not available on this host "
+            f"(have: {', '.join(_SENDER_HASHES)}); install the same optional "
+            "packages on every host"
+        ) from None
+
+
+def crc32_id(
+    aid: str, crc: Callable[[bytes], int] = _SENDER_HASHES[DEFAULT_SENDER_HASH]
+) -> int:
     """Stable 32‑bit ID for *aid* (same across processes)."""
-    return zlib.crc32(aid.encode()) & 0xFFFFFFFF
+    return crc(aid.encode()) & 0xFFFFFFFF
+
+
+def load_algorithm(cfg: Dict, algo: str) -> Type[Algorithm]:
+    """Return the algorithm class named in the run‑file.
+
+    The runner resolves the registry key once and records the class's
+    ``module``/``class``, so agents import it directly.  Run‑files without
+    that entry fall back to the ``algorithms.<algo>`` registry lookup.
+    """
+    spec = cfg.get("algorithm", {})
+    if "module" in spec:
+        return getattr(importlib.import_module(spec["module"]), spec["class"])
+    importlib.import_module(f"algorithms.{algo}")
+    return get_algorithm(algo)
 
 
 # ---------------------------------------------------------------------------
@@ -61,75 +125,134 @@ def crc32_id(aid: str) -> int:
 def run_agent(opts: argparse.Namespace) -> None:
     cfg = load_runfile(Path(opts.runfile))
 
-    slot_cfg = SlotConfig(cfg["slot_sec"], cfg["t0_epoch_ms"] / 1000)
-    rounds: int = cfg["rounds"]
-
     agents_cfg = cfg["agents"]
     my_cfg = agents_cfg[opts.id]
 
-    neigh_ids = my_cfg["neigh"]
-    neigh_endpoints = [
-        build_endpoint(agents_cfg[n]["host"], agents_cfg[n]["pub"]) for n in neigh_ids
+    # Run-files from before endpoints were precomputed only carry host/pub.
+    neigh_endpoints = my_cfg.get("neigh_endpoints") or [
+        agent_endpoint(agents_cfg[n]) for n in my_cfg["neigh"]
     ]
-    transport = ZmqTransport(pub_port=my_cfg["pub"], neigh_endpoints=neigh_endpoints)
+    transport = ZmqTransport(
+        pub_port=my_cfg.get("pub", 0),
+        neigh_endpoints=neigh_endpoints,
+        pub_endpoint=my_cfg.get("endpoint"),
+        io_threads=max(1, len(neigh_endpoints) // 8),
+    )
+    log_path = Path(opts.log or f"agent_{opts.id}.bin")
+    try:
+        with log_path.open("wb") as traj_out:
+            converged_at = run_agent_core(
+                cfg,
+                opts.id,
+                transport,
+                algo=opts.algo,
+                initial=opts.initial,
+                eps=opts.eps,
+                traj_out=traj_out,
+            )
+    finally:
+        transport.close()
+    if converged_at is not None:
+        print(f"# converged {converged_at}")
+
+
+def run_agent_core(
+    cfg: Dict,
+    agent_id: str,
+    transport: ZmqTransport,
+    *,
+    algo: str,
+    initial: float,
+    eps: float,
+    traj_out: BinaryIO,
+) -> Optional[int]:
+    """Run the slot loop for *agent_id* over an already built ``transport``.
+
+    Split from :func:`run_agent` so the runner can drive many agents as
+    threads of one process (shared context, ``inproc://`` endpoints).  The
+    caller owns ``transport`` and ``traj_out``.
+
+    Each round appends one ``_LOG`` record to ``traj_out``.  Returns the
+    round at which the algorithm converged, or ``None`` if it ran out of
+    rounds.
+    """
+    slot_cfg = SlotConfig(cfg["slot_sec"], cfg["t0_epoch_ms"] / 1000)
+    rounds: int = cfg["rounds"]
+
+    neigh_ids = cfg["agents"][agent_id]["neigh"]
 
     # dynamic plugin load --------------------------------------------------
-    importlib.import_module(f"algorithms.{opts.algo}")
-    AlgoCls = get_algorithm(opts.algo)
+    AlgoCls = load_algorithm(cfg, algo)
     alg: Algorithm = AlgoCls()
     alg.initialise(
-        agent_id=opts.id,
-        initial_value=opts.initial,
+        agent_id=agent_id,
+        initial_value=initial,
         neighbours=neigh_ids,
         params=cfg.get("algorithm", {}).get("params", {}),
     )
-    value = opts.initial
-
-    my_crc = crc32_id(opts.id)
-
-    csv_out = sys.stdout
-    eps = opts.eps
+    value = initial
 
-    for k in range(rounds):
-        wait_for_round_start(slot_cfg, k)
+    # Run-files written before the key existed always used zlib's CRC-32.
+    crc = sender_hash(cfg.get("sender_hash", "crc32"))
+    my_crc = crc32_id(agent_id, crc)
+    # Reverse map built once – per-packet sender resolution is one dict hit.
+    # Only neighbours are listed, so stray frames resolve to None.
+    crc_to_id = {crc32_id(aid, crc): aid for aid in neigh_ids}
 
-        # --- broadcast ----------------------------------------------------
-        header = my_crc.to_bytes(4, "big") + k.to_bytes(4, "big")
-        transport.send(header + struct.pack("!d", value))
+    # A drain right at the slot boundary can already hold neighbours' frames
+    # for the next round; keep those instead of discarding them.  The two
+    # dicts are swapped and cleared each round rather than reallocated.
+    inbox: MutableMapping[str, float] = {}
+    early: MutableMapping[str, float] = {}
 
-        # --- gather -------------------------------------------------------
-        inbox: MutableMapping[str, float] = {}
-        deadline = slot_cfg.deadline(k)
-        while time.time() < deadline:
-            raw = transport.recv_nowait()
-            if not raw or len(raw) != 16:
-                time.sleep(0.00005)
-                continue
-            src_crc = int.from_bytes(raw[0:4], "big")
-            if int.from_bytes(raw[4:8], "big") != k:
-                continue
-            src_id = _crc_lookup(src_crc, agents_cfg)
-            if not src_id:
-                continue
-            inbox[src_id] = struct.unpack("!d", raw[8:16])[0]
+    # Records are batched and flushed every _LOG_FLUSH_ROUNDS rounds (and on
+    # exit) instead of once per round.
+    log_buf = bytearray()
+    flush_bytes = _LOG_FLUSH_ROUNDS * _LOG.size
 
-        value = alg.step(k, inbox)
-        csv_out.write(f"{k},{value}\n")
-        csv_out.flush()
-        if eps > 0 and alg.converged(eps=eps):
-            csv_out.write(f"# converged {k}\n"); csv_out.flush(); break
+    try:
+        for k in range(rounds):
+            wait_for_round_start(slot_cfg, k)
 
-    transport.close()
+            # --- broadcast ------------------------------------------------
+            transport.send(_MSG.pack(my_crc, k, value))
 
+            # --- gather ---------------------------------------------------
+            inbox, early = early, inbox
+            early.clear()
+            deadline_ns = slot_cfg.deadline_ns(k)
+            while True:
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    break
+                # round the timeout up: flooring gives poll(0) – a busy spin –
+                # for the whole last millisecond of every slot
+                if not transport.poll(-(-remaining_ns // 1_000_000)):
+                    continue
+                # drain everything that is ready before parking again
+                for raw in transport.drain():
+                    if len(raw) != _MSG.size:
+                        continue
+                    src_crc, rk, v = _MSG.unpack(raw)
+                    src_id = crc_to_id.get(src_crc)
+                    if not src_id:
+                        continue
+                    if rk == k:
+                        inbox[src_id] = v
+                    elif rk == k + 1:
+                        early[src_id] = v
 
-# ---------------------------------------------------------------------------
-# CRC reverse lookup (tiny N → linear scan)
-# ---------------------------------------------------------------------------
-
-def _crc_lookup(crc: int, agents_cfg: Dict[str, Dict]) -> str | None:
-    for aid in agents_cfg:
-        if crc32_id(aid) == crc:
-            return aid
+            value = alg.step(k, inbox)
+            log_buf += _LOG.pack(k, value)
+            if eps > 0 and alg.converged(eps=eps):
+                return k
+            if len(log_buf) >= flush_bytes:
+                traj_out.write(log_buf)
+                traj_out.flush()
+                log_buf.clear()
+    finally:
+        traj_out.write(log_buf)
+        traj_out.flush()
     return None
 
 
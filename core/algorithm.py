@@ -87,7 +87,8 @@ class Algorithm(ABC):
         agent’s time‑slot for *round \*round_no\***.  Keys are
         neighbour IDs, values are the neighbour’s payload (usually a float).
         The implementation **must not mutate** the mapping outside its own
-        call frame.
+        call frame, and must copy it if it needs the values later – the
+        agent loop reuses the same mapping object across rounds.
         """
 
     # Optional --------------------------------------------------------------
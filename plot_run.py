@@ -17,28 +17,26 @@ from __future__ import annotations
 
 import argparse
 import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 
-def load_csv(path: Path) -> Tuple[List[int], List[float]]:
-    rounds: List[int] = []
-    values: List[float] = []
-    with path.open("rt", encoding="utf-8") as fh:
-        for line in fh:
-            if line.startswith("#") or not line.strip():
-                continue
-            k_str, v_str = line.strip().split(",")
-            rounds.append(int(k_str))
-            values.append(float(v_str))
-    return rounds, values
+# Matches core.agent._LOG: packed little-endian (int32 round, float64 value)
+LOG_DTYPE = np.dtype([("k", "<i4"), ("v", "<f8")])
+
+
+def load_bin(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    data = np.fromfile(path, dtype=LOG_DTYPE)
+    return data["k"], data["v"]
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser("Plot consensus trajectories")
-    p.add_argument("run_dir", help="Runner output directory (contains agent_*.csv)")
+    p.add_argument("run_dir", help="Runner output directory (contains agent_*.bin)")
     p.add_argument("-o", "--out", help="Optional PNG path to save the figure")
     p.add_argument("--no-show", action="store_true", help="Do not pop up a GUI window")
     return p.parse_args()
@@ -48,18 +46,21 @@ def main() -> None:
     opts = parse_args()
     run_dir = Path(opts.run_dir)
 
-    csv_paths = sorted(run_dir.glob("agent_*.csv"))
-    if not csv_paths:
-        raise SystemExit(f"No agent_*.csv files found in {run_dir}")
+    log_paths = sorted(run_dir.glob("agent_*.bin"))
+    if not log_paths:
+        raise SystemExit(f"No agent_*.bin files found in {run_dir}")
 
     fig, ax = plt.subplots()
     ax.set_xlabel("Round")
     ax.set_ylabel("Value")
     ax.set_title(f"Consensus trajectories – {run_dir.name}")
 
-    for csv in csv_paths:
-        aid = csv.stem.split("_", 1)[1]  # agent_<ID>.csv → <ID>
-        k, v = load_csv(csv)
+    # overlap file I/O across agents; decoding is a raw numpy view
+    with ThreadPoolExecutor() as ex:
+        trajectories = list(ex.map(load_bin, log_paths))
+
+    for path, (k, v) in zip(log_paths, trajectories):
+        aid = path.stem.split("_", 1)[1]  # agent_<ID>.bin → <ID>
         ax.plot(k, v, label=aid)
 
     ax.legend(title="Agent")
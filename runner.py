@@ -3,10 +3,11 @@ runner.py – orchestrator for the slot-synchronised consensus demo
 -----------------------------------------------------------------
 
 ✔  generates or loads a topology  
-✔  assigns free TCP ports  
+✔  assigns free TCP ports (or IPC socket paths with ``--transport ipc``)  
 ✔  writes a *run-file* with the full runtime contract  
-✔  spawns one **agent** process per node  
-✔  tees every agent’s combined stdout/-err to <run_dir>/agent_<ID>.csv  
+✔  spawns one **agent** process per node (or thread with ``--inprocess``)  
+✔  collects each agent’s binary trajectory in <run_dir>/agent_<ID>.bin  
+✔  tees every agent’s combined stdout/-err to <run_dir>/agent_<ID>.log  
 ✔  exits cleanly (Ctrl-C OK) and prints log location
 
 Run one machine / random graph example
@@ -20,21 +21,30 @@ Run one machine / random graph example
 from __future__ import annotations
 
 import argparse
+import importlib
 import json
 import os
 import random
+import selectors
+import shutil
 import socket
 import subprocess as sp
 import sys
+import tempfile
 import threading
 import time
+import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import BinaryIO, Dict, List, Optional, Sequence
 
 import yaml
+import zmq
 
 import topo as topo_mod
+from comm.zmq_transport import ZmqTransport, build_endpoint
+from core.agent import DEFAULT_SENDER_HASH, run_agent_core
+from core.algorithm import get_algorithm
 from sync.timeslot import compute_t0
 
 # ---------------------------------------------------------------------------#
@@ -71,6 +81,17 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
 
     p.add_argument("--eps", type=float, default=0.0)
     p.add_argument("--base-port", type=int, default=5500)
+    p.add_argument(
+        "--transport",
+        choices=("tcp", "ipc"),
+        default="tcp",
+        help="ZeroMQ transport between agents (ipc = Unix domain sockets)",
+    )
+    p.add_argument(
+        "--inprocess",
+        action="store_true",
+        help="Run agents as threads of the runner over inproc:// (overrides --transport)",
+    )
     p.add_argument(
         "--out",
         default=datetime.now().strftime("run_%Y%m%d-%H%M%S"),
@@ -85,118 +106,91 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
 
 
 def pick_free_ports(start: int, n: int) -> List[int]:
-    """Return *n* consecutive free TCP ports starting at ≥ *start*."""
-    ports: List[int] = []
-    cand = start
-    while len(ports) < n:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+    """Return *n* distinct free TCP ports picked by the kernel.
+
+    All probe sockets are bound to port 0 and held open together, so the
+    kernel hands out *n* distinct ephemeral ports in a single pass.  *start*
+    is only a hint kept for CLI compatibility (``--base-port``).
+    """
+    socks = [socket.socket(socket.AF_INET, socket.SOCK_STREAM) for _ in range(n)]
+    try:
+        for s in socks:
             s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            try:
-                s.bind(("", cand))
-                ports.append(cand)
-            except OSError:
-                pass  # busy
-            cand += 1
-    return ports
+            s.bind(("", 0))
+        return [s.getsockname()[1] for s in socks]
+    finally:
+        for s in socks:
+            s.close()
 
 
-class Tee(threading.Thread):
+class TeeMux(threading.Thread):
     """
-    Copy *src_fh* (bytes) to *dst_fh*.
+    Copy many *src_fh* pipes (bytes) to their *dst_fh* from **one** thread.
 
-    *dst_fh* may be an already-open file **or** a Path – in the latter case
-    the file is opened in binary mode and closed automatically on exit.
+    Register every pair with :meth:`register` before :meth:`start`.  *dst_fh*
+    may be an already-open file **or** a Path – in the latter case the file
+    is opened in binary mode and closed automatically at EOF.
     """
 
-    def __init__(self, src_fh, dst_fh, mirror_console: bool = False):
+    def __init__(self) -> None:
         super().__init__(daemon=True)
-        from pathlib import Path as _Path  # local import to avoid early cost
+        self._sel = selectors.DefaultSelector()
+        self._halt_evt = threading.Event()
+        # one reusable read buffer – no per-chunk bytes allocation
+        self._buf = bytearray(65536)
+        self._view = memoryview(self._buf)
 
-        self.src = src_fh
-        if isinstance(dst_fh, _Path):
-            self.dst = dst_fh.open("wb")
-            self._close_dst = True
+    def register(self, src_fh, dst_fh, mirror_console: bool = False) -> None:
+        if isinstance(dst_fh, Path):
+            dst, close_dst = dst_fh.open("wb"), True
         else:
-            self.dst = dst_fh
-            self._close_dst = False
-
-        self.echo = mirror_console
-        self._halt_evt = threading.Event()
+            dst, close_dst = dst_fh, False
+        self._sel.register(
+            src_fh.fileno(), selectors.EVENT_READ, (dst, close_dst, mirror_console)
+        )
 
     def run(self) -> None:  # noqa: D401
-        while not self._halt_evt.is_set():
-            line = self.src.readline()
-            if not line:
-                break  # stream closed
-            self.dst.write(line)
-            self.dst.flush()
-            if self.echo:
-                sys.stdout.write(line.decode(errors="replace"))
-        if self._close_dst:
-            self.dst.close()
+        while self._sel.get_map():
+            events = self._sel.select(timeout=0.1)
+            if not events and self._halt_evt.is_set():
+                break
+            for key, _ in events:
+                dst, close_dst, echo = key.data
+                n = os.readv(key.fd, (self._buf,))
+                if not n:  # stream closed
+                    self._sel.unregister(key.fd)
+                    if close_dst:
+                        dst.close()
+                    else:
+                        dst.flush()
+                    continue
+                chunk = self._view[:n]
+                dst.write(chunk)  # buffered – flushed on close / EOF
+                if echo:
+                    sys.stdout.write(str(chunk, errors="replace"))
+        # halted with sources still open – don't lose what was buffered
+        for key in list(self._sel.get_map().values()):
+            dst, close_dst, _ = key.data
+            if close_dst:
+                dst.close()
+            else:
+                dst.flush()
+        self._sel.close()
 
     def stop(self) -> None:  # noqa: D401
         self._halt_evt.set()
         self.join(timeout=2.0)
 
 
-# ---------------------------------------------------------------------------#
-# Main                                                                        #
-# ---------------------------------------------------------------------------#
-
-
-def main(opts: argparse.Namespace) -> None:  # noqa: D401
-    out_dir = Path(opts.out).resolve()
-    out_dir.mkdir(parents=True, exist_ok=False)
-
-    # 1 · Topology --------------------------------------------------------
-    if opts.topo:
-        topo = topo_mod.load_yaml(opts.topo)
-    else:
-        n = int(opts.random[0])
-        avg_deg = float(opts.random[1])
-        topo = topo_mod.random_connected(n, avg_deg, seed=opts.seed)
-        (out_dir / "topo.yaml").write_text(
-            yaml.safe_dump(
-                {"agents": list(topo.agents), "edges": [list(e) for e in topo.edges]}
-            ),
-            encoding="utf-8",
-        )
-
-    # 2 · Per-agent initial values ---------------------------------------
-    rng = random.Random(opts.seed)
-    init_vals = {
-        aid: rng.uniform(opts.init_min, opts.init_max) for aid in topo.agents
-    }
-
-    # 3 · Ports -----------------------------------------------------------
-    ports = pick_free_ports(opts.base_port, len(topo.agents))
-    aid2port = dict(zip(topo.agents, ports))
-
-    # 4 · Run-file --------------------------------------------------------
-    t0 = compute_t0(opts.slot, opts.holdoff)
-    runfile = {
-        "slot_sec": opts.slot,
-        "t0_epoch_ms": int(t0 * 1000),
-        "rounds": opts.rounds,
-        "agents": {
-            aid: {
-                "pub": aid2port[aid],
-                "host": "127.0.0.1",
-                "neigh": topo.neighbour_map[aid],
-                "initial": init_vals[aid],
-            }
-            for aid in topo.agents
-        },
-        "algorithm": {"name": opts.algo, "params": {}},
-        "initial_range": [opts.init_min, opts.init_max],
-        "seed": opts.seed,
-    }
-    runfile_path = out_dir / "runfile.json"
-    runfile_path.write_text(json.dumps(runfile, indent=2), encoding="utf-8")
-
-    # 5 · Spawn agents ----------------------------------------------------
-    tees: List[Tee] = []
+def run_subprocesses(
+    runfile_path: Path,
+    agent_ids: Sequence[str],
+    init_vals: Dict[str, float],
+    out_dir: Path,
+    opts: argparse.Namespace,
+) -> None:
+    """Spawn one agent **process** per node and wait for all to exit."""
+    tee = TeeMux()
     procs: Dict[str, sp.Popen] = {}
 
     agent_script = Path(__file__).parent / "core" / "agent.py"
@@ -205,8 +199,8 @@ def main(opts: argparse.Namespace) -> None:  # noqa: D401
     base_env = os.environ.copy()
     base_env["PYTHONPATH"] = f"{root_dir}:{base_env.get('PYTHONPATH', '')}"
 
-    for aid in topo.agents:
-        log_path = out_dir / f"agent_{aid}.csv"
+    for aid in agent_ids:
+        log_path = out_dir / f"agent_{aid}.log"
 
         proc_env = base_env.copy()
         p = sp.Popen(
@@ -223,6 +217,8 @@ def main(opts: argparse.Namespace) -> None:  # noqa: D401
                 str(init_vals[aid]),
                 "--eps",
                 str(opts.eps),
+                "--log",
+                str(out_dir / f"agent_{aid}.bin"),
             ],
             stdout=sp.PIPE,
             stderr=sp.STDOUT,
@@ -230,16 +226,15 @@ def main(opts: argparse.Namespace) -> None:  # noqa: D401
         )
 
         procs[aid] = p
-        tee = Tee(p.stdout, log_path)  # Path is fine – Tee will open it
-        tee.start()
-        tees.append(tee)
+        tee.register(p.stdout, log_path)  # Path is fine – TeeMux will open it
+
+    tee.start()
 
     print(
         f"[runner] t₀ in {opts.holdoff * opts.slot:.2f}s – "
         f"{len(procs)} agents running"
     )
 
-    # 6 · Monitor ---------------------------------------------------------
     try:
         while procs:
             for aid, proc in list(procs.items()):
@@ -252,15 +247,195 @@ def main(opts: argparse.Namespace) -> None:  # noqa: D401
         for proc in procs.values():
             proc.terminate()
     finally:
-        for tee in tees:
-            tee.stop()
+        tee.stop()
+
+
+def run_inprocess(runfile: Dict, out_dir: Path, opts: argparse.Namespace) -> None:
+    """Run every agent as a **thread** of this process over ``inproc://``.
+
+    All transports share one ``zmq.Context`` (inproc endpoints are only
+    reachable within a context), which skips N interpreter cold starts and
+    N loopback TCP stacks.  The GIL serialises the agents' Python work, so
+    this mode suits many light agents rather than heavy per‑round compute.
+    """
+    ctx = zmq.Context.instance()
+    agents_cfg = runfile["agents"]
+    transports: Dict[str, ZmqTransport] = {}
+    logs: Dict[str, BinaryIO] = {}
+    threads: Dict[str, threading.Thread] = {}
+    errors: Dict[str, BaseException] = {}
+    converged: Dict[str, Optional[int]] = {}
+
+    def agent_main(aid: str, **kwargs) -> None:
+        # Record the convergence round / failure for the monitor loop below
+        try:
+            converged[aid] = run_agent_core(runfile, aid, transports[aid], **kwargs)
+        except BaseException as exc:  # noqa: BLE001 – re-raised by the runner
+            errors[aid] = exc
+            traceback.print_exception(exc)
+
+    try:
+        for aid, acfg in agents_cfg.items():
+            transports[aid] = ZmqTransport(
+                pub_port=0,
+                neigh_endpoints=acfg["neigh_endpoints"],
+                ctx=ctx,
+                pub_endpoint=acfg["endpoint"],
+            )
+
+        for aid in transports:
+            log_fh = (out_dir / f"agent_{aid}.bin").open("wb")
+            logs[aid] = log_fh
+            th = threading.Thread(
+                target=agent_main,
+                args=(aid,),
+                kwargs=dict(
+                    algo=opts.algo,
+                    initial=agents_cfg[aid]["initial"],
+                    eps=opts.eps,
+                    traj_out=log_fh,
+                ),
+                name=f"agent-{aid}",
+                daemon=True,
+            )
+            th.start()
+            threads[aid] = th
+
+        print(
+            f"[runner] t₀ in {opts.holdoff * opts.slot:.2f}s – "
+            f"{len(threads)} agent threads running"
+        )
+
+        while threads:
+            for aid, th in list(threads.items()):
+                if not th.is_alive():
+                    if aid in errors:
+                        print(f"[runner] {aid} failed: {errors[aid]!r}")
+                    elif converged.get(aid) is not None:
+                        # same information process mode logs as "# converged k"
+                        print(f"[runner] {aid} converged at round {converged[aid]}")
+                    else:
+                        print(f"[runner] {aid} finished")
+                    threads.pop(aid)
+            time.sleep(0.2)
+    except KeyboardInterrupt:
+        # Threads cannot be killed; they are daemons and die with us.
+        print("[runner] ^C – abandoning agent threads …")
+    finally:
+        if not threads:
+            for transport in transports.values():
+                transport.close()
+        # Abandoned threads still write their trajectory on exit – leave
+        # their files open.
+        for aid, log_fh in logs.items():
+            if aid not in threads:
+                log_fh.close()
+
+    if errors:
+        raise RuntimeError(f"agent thread(s) failed: {', '.join(sorted(errors))}")
+
+
+# ---------------------------------------------------------------------------#
+# Main                                                                        #
+# ---------------------------------------------------------------------------#
+
+
+def main(argv: List[str] | None = None) -> None:  # noqa: D401
+    opts = parse_args(argv)
+
+    # Resolve the plugin once here; agents import the recorded class path.
+    importlib.import_module(f"algorithms.{opts.algo}")
+    algo_cls = get_algorithm(opts.algo)
+
+    out_dir = Path(opts.out).resolve()
+    out_dir.mkdir(parents=True, exist_ok=False)
+
+    # 1 · Topology --------------------------------------------------------
+    if opts.topo:
+        topo = topo_mod.load_yaml(opts.topo)
+    else:
+        n = int(opts.random[0])
+        avg_deg = float(opts.random[1])
+        topo = topo_mod.random_connected(n, avg_deg, seed=opts.seed)
+        (out_dir / "topo.yaml").write_text(
+            yaml.safe_dump(
+                {"agents": list(topo.agents), "edges": [list(e) for e in topo.edges]}
+            ),
+            encoding="utf-8",
+        )
+
+    # 2 · Per-agent initial values ---------------------------------------
+    rng = random.Random(opts.seed)
+    init_vals = {
+        aid: rng.uniform(opts.init_min, opts.init_max) for aid in topo.agents
+    }
+
+    # 3 · Endpoints -------------------------------------------------------
+    ipc_dir: Path | None = None
+    if opts.inprocess:
+        aid2net = {aid: {"endpoint": f"inproc://agent_{aid}"} for aid in topo.agents}
+    elif opts.transport == "ipc":
+        # Unix socket paths are length-limited, so keep them short under /tmp;
+        # a fresh directory per run keeps concurrent runs from stealing binds
+        ipc_dir = Path(tempfile.mkdtemp(prefix="consensus_"))
+        aid2net = {
+            aid: {"endpoint": f"ipc://{ipc_dir}/agent_{aid}.sock"}
+            for aid in topo.agents
+        }
+    else:
+        ports = pick_free_ports(opts.base_port, len(topo.agents))
+        aid2net = {
+            aid: {"endpoint": build_endpoint("127.0.0.1", port)}
+            for aid, port in zip(topo.agents, ports)
+        }
+
+    # 4 · Run-file --------------------------------------------------------
+    t0 = compute_t0(opts.slot, opts.holdoff)
+    neigh_map = topo.neighbour_map
+    runfile = {
+        "slot_sec": opts.slot,
+        "t0_epoch_ms": int(t0 * 1000),
+        "rounds": opts.rounds,
+        "agents": {
+            aid: {
+                **aid2net[aid],
+                "neigh": neigh_map[aid],
+                # resolved once here so agents connect without any lookups
+                "neigh_endpoints": [aid2net[n]["endpoint"] for n in neigh_map[aid]],
+                "initial": init_vals[aid],
+            }
+            for aid in topo.agents
+        },
+        "algorithm": {
+            "name": opts.algo,
+            "module": algo_cls.__module__,
+            "class": algo_cls.__qualname__,
+            "params": {},
+        },
+        "initial_range": [opts.init_min, opts.init_max],
+        "seed": opts.seed,
+        # wire-level sender IDs – every agent must hash with this variant
+        "sender_hash": DEFAULT_SENDER_HASH,
+    }
+    runfile_path = out_dir / "runfile.json"
+    runfile_path.write_text(json.dumps(runfile, indent=2), encoding="utf-8")
+
+    # 5 · Spawn agents & monitor -----------------------------------------
+    try:
+        if opts.inprocess:
+            run_inprocess(runfile, out_dir, opts)
+        else:
+            run_subprocesses(runfile_path, topo.agents, init_vals, out_dir, opts)
+    finally:
+        if ipc_dir is not None:
+            shutil.rmtree(ipc_dir, ignore_errors=True)
 
     print(f"[runner] logs in {out_dir}")
 
 
 if __name__ == "__main__":
     try:
-        main(parse_args())
+        main()
     except Exception as exc:
         sys.stderr.write(f"runner fatal error: {exc}\n")
         sys.exit(1)
@@ -2,11 +2,12 @@
 
 Slot‑based global synchronisation utilities.
 
-This module is completely stateless; everything a caller needs is the
-immutable :class:`SlotConfig` value object plus a couple of helper
-functions.  The goal is to keep **all** timing logic in one place so that
-changing the slot width or the start time requires _zero_ edits elsewhere
-in the code base.
+Apart from one realtime→monotonic clock offset sampled at import, this
+module is stateless; everything a caller needs is the immutable
+:class:`SlotConfig` value object plus a couple of helper functions.
+The goal is to keep **all** timing logic in one place so that changing
+the slot width or the start time requires _zero_ edits elsewhere in the
+code base.
 
 Usage example (agent side)  ────────────────────────────────────────────
 >>> cfg = SlotConfig(slot_sec=0.10, t0_epoch=compute_t0(0.10, 3))
@@ -17,22 +18,38 @@ Usage example (agent side)  ─────────────────
 ...     my_value = step(k, inbox)
 
 All sleeps spin‑wait down to the sub‑millisecond range for good
-slot‑boundary accuracy while still yielding to the OS most of the time.
+slot‑boundary accuracy while still sleeping in the OS most of the time.
 """
 
 from __future__ import annotations
 
+import os
 import time
-from dataclasses import dataclass
-from typing import Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Tuple
 
 __all__ = [
     "SlotConfig",
     "compute_t0",
     "sleep_until",
+    "sleep_until_ns",
     "wait_for_round_start",
 ]
 
+# sleep_until phases: OS sleep until this close, then yield, then spin.
+_SLEEP_MARGIN_NS = 2_000_000
+_SPIN_WINDOW_NS = 100_000
+_SPIN_BURST_MAX = 64  # clock polls between sched_yield calls, upper bound
+
+# Realtime − monotonic, sampled once per process.  Epoch timestamps (shared
+# between processes via the run‑file) are mapped onto the monotonic clock
+# with this single offset, so slot timing is immune to NTP steps.
+_MONO_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _epoch_to_mono_ns(epoch: float) -> int:
+    return round(epoch * 1e9) - _MONO_OFFSET_NS
+
 
 @dataclass(frozen=True, slots=True)
 class SlotConfig:
@@ -41,15 +58,20 @@ class SlotConfig:
     slot_sec: float  #: Width of a slot in **seconds** (e.g. ``0.10`` for 100 ms)
     t0_epoch: float  #: UNIX epoch seconds when *round 0* starts
 
+    # Integer views derived in __post_init__ – hot paths use these.
+    slot_ns: int = field(init=False, repr=False, compare=False)  #: slot width, ns
+    t0_ns: int = field(init=False, repr=False, compare=False)  #: t0 on ``monotonic_ns``
+    slot_ms: int = field(init=False, repr=False, compare=False)  #: slot width, ms (logs)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "slot_ns", round(self.slot_sec * 1e9))
+        object.__setattr__(self, "t0_ns", _epoch_to_mono_ns(self.t0_epoch))
+        object.__setattr__(self, "slot_ms", int(self.slot_sec * 1000))
+
     # ------------------------------------------------------------------
     # Convenience helpers
     # ------------------------------------------------------------------
 
-    @property
-    def slot_ms(self) -> int:
-        """Slot width in *milliseconds* as an ``int`` (handy for logs)."""
-        return int(self.slot_sec * 1000)
-
     def window(self, round_no: int) -> Tuple[float, float]:
         """Return *(start, end)* epoch seconds for *round \*round_no\**."""
         start = self.t0_epoch + round_no * self.slot_sec
@@ -59,16 +81,23 @@ class SlotConfig:
         """Epoch seconds for the *end* of *round \*round_no\**."""
         return self.t0_epoch + (round_no + 1) * self.slot_sec
 
-    def round_at(self, now: Optional[float] = None) -> int:
-        """Compute the *current* round number for the given ``now`` timestamp.
+    def deadline_ns(self, round_no: int) -> int:
+        """``time.monotonic_ns()`` value at the *end* of round ``round_no``."""
+        return self.t0_ns + (round_no + 1) * self.slot_ns
+
+    def round_at(self, now_ns: int) -> int:
+        """Compute the round number at monotonic time ``now_ns``.
 
-        Returns ``‑1`` if ``now`` is still before *t0* (pre‑sync warm‑up).
+        Returns ``‑1`` if ``now_ns`` is still before *t0* (pre‑sync warm‑up).
+        Loops should read the clock once per iteration and pass it in.
         """
-        if now is None:
-            now = time.time()
-        if now < self.t0_epoch:
+        if now_ns < self.t0_ns:
             return -1
-        return int((now - self.t0_epoch) // self.slot_sec)
+        return (now_ns - self.t0_ns) // self.slot_ns
+
+    def round_at_now(self) -> int:
+        """:meth:`round_at` for the *current* ``time.monotonic_ns()``."""
+        return self.round_at(time.monotonic_ns())
 
 
 # ----------------------------------------------------------------------
@@ -85,22 +114,42 @@ def compute_t0(slot_sec: float, holdoff_slots: int = 3) -> float:
 
 
 def sleep_until(target_epoch: float) -> None:
-    """Sleep until ``target_epoch`` with sub‑millisecond accuracy.
+    """Sleep until ``target_epoch`` (UNIX seconds); see :func:`sleep_until_ns`."""
+    sleep_until_ns(_epoch_to_mono_ns(target_epoch))
+
+
+def sleep_until_ns(target_ns: int) -> None:
+    """Sleep until ``time.monotonic_ns()`` reaches ``target_ns``.
 
-    We first sleep in coarse chunks (10 % of remaining time) and fall back
-    to a short busy‑wait when < 1 ms remains to minimise boundary skew.
+    One coarse ``time.sleep`` covers all but the last ~2 ms, a spin/yield
+    backoff covers the next stretch and a tight spin the final ~100 µs – so
+    long waits cost O(1) clock reads instead of one per millisecond, with
+    sub‑millisecond boundary accuracy.
     """
-    while True:
-        now = time.time()
-        delta = target_epoch - now
-        if delta <= 0:
-            break
-        # Coarse sleep for most of the interval, then finer grained as we close in.
-        coarse = min(delta * 0.1, 0.001)  # never longer than 1 ms
-        time.sleep(coarse)
+    remaining = target_ns - time.monotonic_ns()
+    if remaining <= 0:
+        return
+
+    if remaining > _SLEEP_MARGIN_NS:
+        time.sleep((remaining - _SLEEP_MARGIN_NS) / 1e9)
+
+    # spin_k / yield_k backoff: bursts of clock polls that double in length
+    # between sched_yield calls, so an idle core stays on‑CPU while a busy
+    # one still gets the processor back quickly.
+    yield_until = target_ns - _SPIN_WINDOW_NS
+    burst = 1
+    while (now := time.monotonic_ns()) < yield_until:
+        for _ in range(burst):
+            if time.monotonic_ns() >= yield_until:
+                break
+        else:
+            os.sched_yield()
+            burst = min(burst * 2, _SPIN_BURST_MAX)
+    while now < target_ns:
+        now = time.monotonic_ns()
 
 
 def wait_for_round_start(cfg: SlotConfig, round_no: int) -> None:
     """Block until the *start* of *round \*round_no\** according to ``cfg``."""
-    start, _ = cfg.window(round_no)
-    sleep_until(start)
+    # hot path: one integer multiply-add, no tuple, no epoch conversion
+    sleep_until_ns(cfg.t0_ns + round_no * cfg.slot_ns)
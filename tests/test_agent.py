@@ -0,0 +1,23 @@
+# tests/test_agent.py
+"""
+Agent helpers: run-file compatibility and sender-ID hashing.
+"""
+import pytest
+
+from core.agent import agent_endpoint, crc32_id, sender_hash
+
+
+def test_agent_endpoint_new_and_old_runfiles():
+    # current run-files carry the full endpoint …
+    assert agent_endpoint({"endpoint": "ipc:///tmp/x/agent_A.sock"}) == (
+        "ipc:///tmp/x/agent_A.sock"
+    )
+    # … older ones only host/port
+    assert agent_endpoint({"host": "10.0.0.2", "pub": 5555}) == "tcp://10.0.0.2:5555"
+
+
+def test_sender_hash_lookup():
+    # zlib's CRC-32 is always available and stable across processes
+    assert crc32_id("A0", sender_hash("crc32")) == 0x8E625C17
+    with pytest.raises(RuntimeError, match="not available"):
+        sender_hash("no-such-hash")
@@ -1,54 +1,119 @@
 """
 End-to-end smoke test: launches a 3-agent run (10 rounds, 50 ms slots)
-in a temporary directory and verifies that CSV logs are produced.
+in a temporary directory and verifies that trajectory logs are produced.
 
 Keeps runtime < 30 s so it’s CI-friendly.
 """
 import json
-import subprocess
-import sys
-import time
 from pathlib import Path
 
+import pytest
 
-def test_runner_smoke(tmp_path):
+import runner
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [[], ["--transport", "ipc"], ["--inprocess"]],
+    ids=["processes", "ipc", "inprocess"],
+)
+def test_runner_smoke(tmp_path, extra):
     run_dir = tmp_path / "out"
 
-    cmd = [
-        sys.executable,
-        "runner.py",
-        "--random",
-        "3",
-        "2",  # N=3, avg_deg≈2
-        "--algo",
-        "wmsr",
-        "--slot",
-        "0.05",
-        "--holdoff",
-        "10",
-        "--rounds",
-        "10",
-        "--seed",
-        "1",
-        "--out",
-        str(run_dir),
-    ]
-
-    # give the subprocess a generous timeout (units: seconds)
-    result = subprocess.run(
-        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=30
+    # call main() directly – no interpreter start-up for the runner itself
+    runner.main(
+        [
+            "--random",
+            "3",
+            "2",  # N=3, avg_deg≈2
+            "--algo",
+            "wmsr",
+            "--slot",
+            "0.05",
+            "--holdoff",
+            "10",
+            "--rounds",
+            "10",
+            "--seed",
+            "1",
+            "--out",
+            str(run_dir),
+            *extra,
+        ]
     )
-    assert result.returncode == 0, result.stderr
 
     # 1. runfile exists and is valid JSON
     runfile = run_dir / "runfile.json"
     assert runfile.exists()
-    json.loads(runfile.read_text())
-
-    # 2. at least one CSV per agent with >1 lines
-    csv_files = list(run_dir.glob("agent_*.csv"))
-    assert csv_files, "no agent_*.csv produced"
-    for csv in csv_files:
-        lines = [ln for ln in csv.read_text().splitlines() if ln and not ln.startswith("#")]
-        # expect 10 rounds → 10 lines
-        assert len(lines) >= 2, f"{csv} is empty"
+    cfg = json.loads(runfile.read_text())
+    assert cfg["sender_hash"] in ("crc32", "crc32c")
+
+    if "ipc" in extra:
+        # endpoints are Unix sockets and their directory is removed afterwards
+        endpoints = [a["endpoint"] for a in cfg["agents"].values()]
+        assert all(ep.startswith("ipc://") for ep in endpoints)
+        sock_dirs = {Path(ep[len("ipc://"):]).parent for ep in endpoints}
+        assert len(sock_dirs) == 1
+        assert not sock_dirs.pop().exists()
+
+    # 2. one binary trajectory per agent with >1 records
+    bin_files = list(run_dir.glob("agent_*.bin"))
+    assert len(bin_files) == 3, "expected one agent_*.bin per agent"
+    for path in bin_files:
+        size = path.stat().st_size
+        # (int32 round, float64 value) records; expect 10 rounds → 10 records
+        assert size % 12 == 0, f"{path} has a partial record"
+        assert size // 12 >= 2, f"{path} is empty"
+
+
+def test_inprocess_agent_failure_fails_run(tmp_path, monkeypatch):
+    """An exception in an agent thread is reported and fails the run."""
+
+    def boom(*args, **kwargs):
+        raise OSError("agent crashed")
+
+    monkeypatch.setattr(runner, "run_agent_core", boom)
+    with pytest.raises(RuntimeError, match="agent thread"):
+        runner.main(
+            [
+                "--random",
+                "3",
+                "2",
+                "--algo",
+                "wmsr",
+                "--slot",
+                "0.05",
+                "--holdoff",
+                "2",
+                "--rounds",
+                "2",
+                "--out",
+                str(tmp_path / "out"),
+                "--inprocess",
+            ]
+        )
+
+
+def test_inprocess_reports_convergence(tmp_path, capsys):
+    """--inprocess reports each agent's convergence round like process mode."""
+    runner.main(
+        [
+            "--random",
+            "3",
+            "2",
+            "--algo",
+            "wmsr",
+            "--slot",
+            "0.05",
+            "--holdoff",
+            "4",
+            "--rounds",
+            "5",
+            "--eps",
+            "1e9",  # every step counts as converged
+            "--out",
+            str(tmp_path / "out"),
+            "--inprocess",
+        ]
+    )
+    assert capsys.readouterr().out.count("converged at round") == 3
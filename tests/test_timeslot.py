@@ -2,14 +2,15 @@ import time
 import math
 import pytest
 
-from sync.timeslot import compute_t0, SlotConfig
+from sync import timeslot
+from sync.timeslot import compute_t0, sleep_until, SlotConfig
 
 
 @pytest.mark.parametrize("slot", [0.02, 0.10])
-def test_deadline_and_round(slot, monkeypatch):
+def test_deadline_and_round(slot):
     """
     Verify that:
-      • round_at() maps now → correct k
+      • round_at(now_ns) maps now → correct k
       • deadline(k) returns the end-of-slot timestamp
     across a couple of slot widths.
     """
@@ -19,12 +20,44 @@ def test_deadline_and_round(slot, monkeypatch):
 
     # check first four rounds
     for k in range(4):
-        fake_now = t0 + k * slot + slot / 2          # mid-slot
-        monkeypatch.setattr(time, "time", lambda: fake_now)
+        now_ns = cfg.t0_ns + k * cfg.slot_ns + cfg.slot_ns // 2  # mid-slot
 
-        assert cfg.round_at() == k
+        assert cfg.round_at(now_ns) == k
         assert math.isclose(cfg.deadline(k), t0 + (k + 1) * slot, rel_tol=1e-9)
+        assert cfg.deadline_ns(k) == cfg.t0_ns + (k + 1) * cfg.slot_ns
 
-    # time before t0 → round -1
-    monkeypatch.setattr(time, "time", lambda: t0 - 1e-4)
-    assert cfg.round_at() == -1
+    # time before t0 → round -1 (holdoff of 5 slots is still running)
+    assert cfg.round_at(cfg.t0_ns - 100_000) == -1
+    assert cfg.round_at_now() == -1
+
+
+def test_sleep_until_hits_target():
+    """
+    sleep_until() must not return early and should land close to the
+    target (generous bound to stay CI-friendly).
+    """
+    for delay in (0.0005, 0.02):
+        target = time.time() + delay
+        sleep_until(target)
+        late = time.time() - target
+        assert 0 <= late < 0.01
+
+
+@pytest.mark.parametrize("slot_ns", [50_000_000, 100_000_000])
+def test_round_at_exact_on_long_runs(slot_ns):
+    """
+    Slot boundaries stay exact to the nanosecond after ~1000 h of rounds.
+
+    The expected boundary is built in exact integer epoch nanoseconds and
+    mapped onto the monotonic clock with the module's offset – not with
+    the ``t0_ns + k * slot_ns`` expression that round_at() inverts.
+    """
+    t0_epoch_s = 1_700_000_000  # whole seconds → exact as float and as ns
+    cfg = SlotConfig(slot_sec=slot_ns / 1e9, t0_epoch=float(t0_epoch_s))
+
+    k = 3_600_000 * 1_000_000_000 // slot_ns
+    boundary_epoch_ns = t0_epoch_s * 1_000_000_000 + k * slot_ns
+    boundary = boundary_epoch_ns - timeslot._MONO_OFFSET_NS
+
+    assert cfg.round_at(boundary) == k
+    assert cfg.round_at(boundary - 1) == k - 1
@@ -2,9 +2,15 @@
 """
 Topology helper tests: generator and YAML loader.
 """
+import copy
+import json
+import pickle
+
+import numpy as np
+import pytest
 import yaml
 
-from topo import random_connected, load_yaml
+from topo import _pair_from_index, random_connected, load_yaml
 
 
 def test_random_connected_is_undirected_and_connected():
@@ -45,4 +51,69 @@ def test_yaml_round_trip(tmp_path):
     yaml_path.write_text(yaml.safe_dump(data), encoding="utf-8")
 
     topo2 = load_yaml(str(yaml_path))
-    assert topo1.edges == topo2.edges
+    # edge order is not part of the contract – compare as sets
+    assert set(topo1.edges) == set(topo2.edges)
+
+
+def test_json_topology(tmp_path):
+    """
+    A .json file with the YAML schema loads through the JSON fast path.
+    """
+    json_path = tmp_path / "g.json"
+    json_path.write_text(
+        json.dumps({"agents": ["A", "B", "C"], "edges": [["B", "A"], ["B", "C"]]}),
+        encoding="utf-8",
+    )
+
+    topo = load_yaml(json_path)
+    assert topo.agents == ("A", "B", "C")
+    assert set(topo.edges) == {("A", "B"), ("B", "C")}
+
+
+def test_pair_index_inversion_matches_triu():
+    for n in (2, 3, 17, 400):
+        iu, ju = np.triu_indices(n, k=1)
+        i, j = _pair_from_index(n, np.arange(iu.size))
+        assert (i == iu).all() and (j == ju).all()
+
+
+def test_sparse_p_warns(caplog):
+    with caplog.at_level("WARNING", logger="topo"):
+        random_connected(20, 1.5, seed=1)
+    assert "below ln(n)/(n-1)" in caplog.text
+
+
+def test_topology_pickle_and_deepcopy():
+    topo = random_connected(6, 2.0, seed=4)
+    for clone in (pickle.loads(pickle.dumps(topo)), copy.deepcopy(topo)):
+        assert clone == topo
+        assert dict(clone.neighbour_map) == dict(topo.neighbour_map)
+
+
+def test_yaml_edges_keep_file_order(tmp_path):
+    """
+    Edges are canonicalised (u < v) and deduplicated, keeping file order –
+    the first occurrence of a duplicate wins.
+    """
+    yaml_path = tmp_path / "g.yaml"
+    yaml_path.write_text(
+        yaml.safe_dump(
+            {"edges": [["C", "D"], ["B", "A"], ["D", "C"], ["A", "C"], ["A", "B"]]}
+        ),
+        encoding="utf-8",
+    )
+
+    topo = load_yaml(yaml_path)
+    assert topo.agents == ("A", "B", "C", "D")  # inferred, sorted
+    assert topo.edges == (("C", "D"), ("A", "B"), ("A", "C"))
+
+
+def test_yaml_duplicate_agent_rejected(tmp_path):
+    yaml_path = tmp_path / "g.yaml"
+    yaml_path.write_text(
+        yaml.safe_dump({"agents": ["A", "B", "A"], "edges": [["A", "B"]]}),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="Duplicate agent"):
+        load_yaml(yaml_path)
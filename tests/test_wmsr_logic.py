@@ -2,7 +2,8 @@
 import math
 import pytest
 
-from algorithms.wmsr import WMSR
+from algorithms._wmsr_kernel import trim_mean
+from algorithms.wmsr import _JIT_MIN_DEGREE, WMSR
 
 # (F, inbox, expected next value)
 CASES = [
@@ -16,6 +17,8 @@ CASES = [
         {"B": 5.0, "C": -2.0, "D": 100.0, "E": -10.0, "F": 1.0},
         (0.0 + 1.0) / 2,  # own value (0) and 1 remain
     ),
+    # duplicates / ties → only F copies of a repeated extreme are dropped
+    (1, {"B": 3.0, "C": 3.0, "D": -1.0, "E": 0.0}, (0.0 + 0.0 + 3.0) / 3),
 ]
 
 
@@ -34,3 +37,33 @@ def test_wmsr_step(F, inbox, expected):
     )
     next_val = alg.step(0, inbox)
     assert math.isclose(next_val, expected, rel_tol=1e-9)
+
+
+@pytest.mark.skipif(trim_mean is None, reason="numba not installed")
+@pytest.mark.parametrize("F,inbox,expected", CASES)
+def test_wmsr_jit_kernel_matches(F, inbox, expected):
+    """
+    The optional Numba kernel must agree with the pure-Python update.
+    """
+    next_val, delta = trim_mean(inbox.values(), 0.0, F)
+    assert math.isclose(next_val, expected, rel_tol=1e-9)
+    assert math.isclose(delta, abs(expected), rel_tol=1e-9)
+
+
+@pytest.mark.parametrize("F", [0, 3])
+def test_wmsr_step_high_degree(F):
+    """
+    With ≥ _JIT_MIN_DEGREE neighbours step() takes the kernel path (when
+    numba is present) and must match the pure-Python update.
+    """
+    inbox = {f"N{i}": float((i * 37) % 101 - 50) for i in range(_JIT_MIN_DEGREE + 6)}
+
+    fast, ref = WMSR(), WMSR()
+    for alg in (fast, ref):
+        alg.initialise(
+            agent_id="A", initial_value=1.5, neighbours=list(inbox), params={"F": F}
+        )
+    ref._jit_trim_mean = None  # force the reference path
+
+    for k in range(3):
+        assert math.isclose(fast.step(k, inbox), ref.step(k, inbox), rel_tol=1e-12)
@@ -36,13 +36,52 @@ def test_inproc_echo(ctx):
     msg = b"hello"
     pub.send(msg)
 
-    deadline = time.time() + 1.0  # 1 s timeout
-    while time.time() < deadline:
-        try:
-            received = sub.recv(flags=zmq.NOBLOCK)
-            assert received == msg
-            break
-        except zmq.Again:
-            time.sleep(0.01)
-    else:
+    # block in the poller (epoll) instead of a recv/sleep loop
+    poller = zmq.Poller()
+    poller.register(sub, zmq.POLLIN)
+    events = dict(poller.poll(1000))  # 1 s timeout
+    if sub not in events:
         pytest.fail("PUB/SUB message not received within 1 s")
+    assert sub.recv(zmq.NOBLOCK) == msg
+
+
+def test_transport_poll_and_drain(ctx):
+    """
+    Two ZmqTransport instances over inproc: poll() reports readiness and
+    drain() batches queued frames up to max_msgs.
+    """
+    tag = random.randint(0, 1 << 30)
+    ep_a, ep_b = f"inproc://a-{tag}", f"inproc://b-{tag}"
+
+    a = ZmqTransport(pub_port=0, neigh_endpoints=[ep_b], ctx=ctx, pub_endpoint=ep_a)
+    b = ZmqTransport(pub_port=0, neigh_endpoints=[ep_a], ctx=ctx, pub_endpoint=ep_b)
+    try:
+        # let the SUB subscriptions propagate before we send
+        time.sleep(0.05)
+
+        # nothing queued yet → poll times out, drain is empty
+        assert b.poll(10) is False
+        assert b.drain() == []
+
+        frames = [bytes([i]) * 4 for i in range(5)]
+        for f in frames:
+            a.send(f)
+        assert b.poll(1000) is True
+        # all frames arrive, in send order (possibly over several polls)
+        deadline = time.monotonic() + 1.0
+        got = []
+        while len(got) < len(frames) and time.monotonic() < deadline:
+            b.poll(100)
+            got += b.drain()
+        assert got == frames
+
+        # max_msgs bounds one drain; the rest stays queued
+        for f in frames:
+            a.send(f)
+        assert b.poll(1000) is True
+        time.sleep(0.05)
+        assert b.drain(max_msgs=2) == frames[:2]
+        assert b.drain() == frames[2:]
+    finally:
+        a.close()
+        b.close()
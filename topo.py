@@ -13,8 +13,10 @@ an (undirected) edge list.  Example::
       - [C, D]
       - [D, A]
 
-If you omit the ``agents`` key the loader infers the agent set from the
-edge list.  Self‑loops are rejected; duplicate edges are collapsed.
+A ``.json`` file with the same keys is accepted too.  If you omit the
+``agents`` key the loader infers the agent set from the edge list.
+Self‑loops are rejected; duplicate edges are collapsed (first occurrence
+wins, file order is kept).
 
 The helper :func:`random_connected` can create a random connected graph
 (with probability 1) of given order and expected average degree – useful
@@ -23,39 +25,63 @@ for quick benches without hand‑crafting YAML.
 
 from __future__ import annotations
 
-import random
-from dataclasses import dataclass
+import json
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Sequence, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Sequence, Set, Tuple
 
+import numpy as np
 import yaml
 
+try:  # libyaml-backed loader is ~20× faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 __all__ = [
     "Topology",
     "load_yaml",
     "random_connected",
 ]
 
+log = logging.getLogger(__name__)
+
+# random_connected fans attempts out to processes from this order upwards;
+# below it, process start-up costs more than a serial attempt.
+_PARALLEL_MIN_N = 200
+
 
 @dataclass(slots=True, frozen=True)
 class Topology:
     """In‑memory topology (undirected)."""
 
     agents: Tuple[str, ...]
-    edges: Tuple[Tuple[str, str], ...]  # canonicalised (low, high)
+    edges: Tuple[Tuple[str, str], ...]  # one entry per undirected edge; compare as sets
 
-    # ---------------------------------------------------------
-    # Convenience views
-    # ---------------------------------------------------------
+    # built once in __post_init__ (the instance is immutable); a plain dict
+    # so the instance stays picklable – exposed read-only via neighbour_map
+    _neigh: Dict[str, Tuple[str, ...]] = field(init=False, repr=False, compare=False)
 
-    @property
-    def neighbour_map(self) -> Dict[str, List[str]]:
-        """Return ``id → [neighbours]`` mapping (order arbitrary)."""
+    def __post_init__(self) -> None:
         neigh: Dict[str, List[str]] = {a: [] for a in self.agents}
         for a, b in self.edges:
             neigh[a].append(b)
             neigh[b].append(a)
-        return neigh
+        object.__setattr__(self, "_neigh", {a: tuple(n) for a, n in neigh.items()})
+
+    # ---------------------------------------------------------
+    # Convenience views
+    # ---------------------------------------------------------
+
+    @property
+    def neighbour_map(self) -> Mapping[str, Tuple[str, ...]]:
+        """Return read-only ``id → (neighbours)`` mapping (order arbitrary)."""
+        return MappingProxyType(self._neigh)
 
 
 # ---------------------------------------------------------------------------
@@ -64,10 +90,14 @@ class Topology:
 
 
 def load_yaml(path: str | Path) -> Topology:
-    """Parse YAML topology file → :class:`Topology`."""
+    """Parse YAML (or same-shaped ``.json``) topology file → :class:`Topology`."""
 
-    with Path(path).open("rt", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+    path = Path(path)
+    with path.open("rt", encoding="utf-8") as fh:
+        if path.suffix == ".json":
+            data = json.load(fh)
+        else:
+            data = yaml.load(fh, Loader=_YamlLoader)
 
     if not isinstance(data, dict):
         raise ValueError("Top-level YAML must map keys → values")
@@ -75,20 +105,23 @@ def load_yaml(path: str | Path) -> Topology:
     agents: List[str] = list(data.get("agents", []))
     edges_raw: Sequence[Sequence[str]] = data.get("edges", [])
 
+    # Validate -------------------------------------------------------------
+    # One walk builds the membership set and catches duplicate IDs
+    agents_set: Set[str] = set()
+    for a in agents:
+        if a in agents_set:
+            raise ValueError("Duplicate agent IDs in 'agents' list")
+        agents_set.add(a)
+
     # Infer agents from edges if not explicitly listed
     if not agents:
-        s: Set[str] = set()
         for u, v in edges_raw:
-            s.add(u)
-            s.add(v)
-        agents = sorted(s)
-
-    # Validate -------------------------------------------------------------
-    if len(set(agents)) != len(agents):
-        raise ValueError("Duplicate agent IDs in 'agents' list")
+            agents_set.add(u)
+            agents_set.add(v)
+        agents = sorted(agents_set)
 
-    agents_set = set(agents)
-    edges: Set[Tuple[str, str]] = set()
+    # dict, not set: dedupes while keeping file order, so no sort is needed
+    edges: Dict[Tuple[str, str], None] = {}
     for pair in edges_raw:
         if len(pair) != 2:
             raise ValueError(f"Malformed edge entry: {pair}")
@@ -98,9 +131,9 @@ def load_yaml(path: str | Path) -> Topology:
         if u not in agents_set or v not in agents_set:
             raise ValueError(f"Edge references unknown agent: {pair}")
         # canonicalise ordering to dedupe
-        edges.add(tuple(sorted((u, v))))
+        edges[(u, v) if u < v else (v, u)] = None
 
-    return Topology(tuple(agents), tuple(sorted(edges)))
+    return Topology(tuple(agents), tuple(edges))
 
 
 # ---------------------------------------------------------------------------
@@ -121,22 +154,91 @@ def random_connected(n: int, avg_degree: float, *, seed: int | None = None) -> T
     if avg_degree <= 0:
         raise ValueError("avg_degree must be > 0")
 
-    rng = random.Random(seed)
     agents = tuple(f"A{i}" for i in range(n))
 
     # Edge probability for given expected degree
     p = min(max(avg_degree / (n - 1), 0.0), 1.0)
 
-    while True:
-        edges: Set[Tuple[str, str]] = set()
-        for i in range(n):
-            for j in range(i + 1, n):
-                if rng.random() < p:
-                    edges.add((agents[i], agents[j]))
-
-        topo = Topology(agents, tuple(sorted(edges)))
-        if _is_connected(topo):
-            return topo
+    # Erdős–Rényi connectivity threshold: below it most draws are rejected,
+    # well above it (c ≥ 2) the first draw is connected almost surely.
+    threshold = math.log(n) / (n - 1)
+    if p < threshold:
+        log.warning(
+            "random_connected: p=%.4g is below ln(n)/(n-1)=%.4g; "
+            "expect many rejected samples", p, threshold,
+        )
+
+    # Attempt k always uses the k-th child seed, so the serial and parallel
+    # paths return the same graph for the same seed.
+    seeds = np.random.SeedSequence(seed)
+    workers = os.cpu_count() or 1
+    # Fan out only near the threshold – well above it the first serial draw
+    # almost always succeeds and a pool is pure start-up overhead.
+    if n >= _PARALLEL_MIN_N and p < 2 * threshold and workers > 1:
+        (src, dst), attempts = _sample_parallel(n, p, seeds, workers)
+    else:
+        attempts = 1
+        while (sample := _sample_once(n, p, seeds.spawn(1)[0])) is None:
+            attempts += 1
+        src, dst = sample
+
+    if attempts > 1 and p >= 2 * threshold:
+        log.warning(
+            "random_connected: %d attempts needed at p=%.4g (≥ 2·ln(n)/(n-1))",
+            attempts, p,
+        )
+
+    # triu order is already deterministic – no sort needed
+    edges = tuple((agents[i], agents[j]) for i, j in zip(src, dst))
+    return Topology(agents, edges)
+
+
+def _pair_from_index(n: int, idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Invert the row-major ``i < j`` linearisation used by ``np.triu_indices``."""
+    # Row i starts at offset i*(2n - i - 1)/2; solve the quadratic for i,
+    # then nudge by one where float rounding lands on the wrong row.
+    b = 2 * n - 1
+    i = np.floor((b - np.sqrt(b * b - 8.0 * idx)) / 2).astype(np.int64)
+    start = i * (b - i) // 2
+    i -= start > idx
+    i += (i + 1) * (b - i - 1) // 2 <= idx
+    start = i * (b - i) // 2
+    return i, idx - start + i + 1
+
+
+def _sample_once(
+    n: int, p: float, seed_seq: np.random.SeedSequence
+) -> Tuple[List[int], List[int]] | None:
+    """One Erdős–Rényi draw; ``(src, dst)`` node IDs if connected, else ``None``."""
+    # One vectorised Bernoulli draw over all pairs i < j; only the accepted
+    # indices are mapped back, so no O(n²) index arrays are materialised.
+    u = np.random.default_rng(seed_seq).random(n * (n - 1) // 2)
+    src, dst = _pair_from_index(n, np.flatnonzero(u < p))
+
+    # Reject/resample on integer IDs; strings only for the accepted graph
+    src, dst = src.tolist(), dst.tolist()
+    return (src, dst) if _is_connected_int(n, src, dst) else None
+
+
+def _sample_parallel(
+    n: int, p: float, seeds: np.random.SeedSequence, workers: int
+) -> Tuple[Tuple[List[int], List[int]], int]:
+    """Run attempts in batches of ``workers`` processes; first success wins.
+
+    Returns the accepted ``(src, dst)`` and its 1-based attempt number.
+    """
+    attempts = 0
+    with ProcessPoolExecutor(workers) as ex:
+        while True:
+            futs = [ex.submit(_sample_once, n, p, s) for s in seeds.spawn(workers)]
+            # consume in submission order so the result is scheduling-independent
+            for fut in futs:
+                attempts += 1
+                sample = fut.result()
+                if sample is not None:
+                    for other in futs:
+                        other.cancel()
+                    return sample, attempts
 
 
 # ---------------------------------------------------------------------------
@@ -144,16 +246,28 @@ def random_connected(n: int, avg_degree: float, *, seed: int | None = None) -> T
 # ---------------------------------------------------------------------------
 
 
-def _is_connected(topo: Topology) -> bool:  # simple BFS
-    if not topo.agents:
-        return True
-    neigh = topo.neighbour_map
-    seen: Set[str] = set()
-    frontier = [topo.agents[0]]
-    while frontier:
-        u = frontier.pop()
-        if u in seen:
+def _is_connected_int(n: int, src: List[int], dst: List[int]) -> bool:
+    """Union-Find over edges ``src[k]–dst[k]`` of nodes ``0..n-1``.
+
+    Path halving + union by rank; stops as soon as a single component
+    remains, so dense graphs typically touch only part of the edge list.
+    """
+    parent = list(range(n))
+    rank = bytearray(n)  # union by rank keeps ranks ≤ log2(n) < 256
+    components = n
+    for i, j in zip(src, dst):
+        while parent[i] != i:
+            parent[i] = i = parent[parent[i]]
+        while parent[j] != j:
+            parent[j] = j = parent[parent[j]]
+        if i == j:
             continue
-        seen.add(u)
-        frontier.extend(neigh[u])
-    return len(seen) == len(topo.agents)
+        if rank[i] < rank[j]:
+            i, j = j, i
+        parent[j] = i
+        if rank[i] == rank[j]:
+            rank[i] += 1
+        components -= 1
+        if components == 1:
+            return True
+    return components <= 1